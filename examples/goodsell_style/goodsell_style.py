@@ -7,17 +7,49 @@
 
 from __future__ import annotations
 
-from psico.viewing import goodsell_lighting
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
 from pymol import cmd, util
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 ####################################################################################################
 ## Define
 ####################################################################################################
 
+# Goodsell-like style settings, applied before the lighting preset
+_GOODSELL_STYLE_SETTINGS: Final[Mapping[str, float | str]] = MappingProxyType(
+    {
+        "specular": 0,
+        "depth_cue": 0,
+        "orthoscopic": 0,
+        "opaque_background": 1,
+        "show_alpha_checker": 0,
+    }
+)
+
+# Goodsell-like rendering settings, applied after the lighting preset
+_GOODSELL_RENDER_SETTINGS: Final[Mapping[str, float | str]] = MappingProxyType(
+    {
+        "antialias": 2,
+        "ray_trace_mode": 1,
+        "ray_trace_gain": 1.5,
+        "ray_trace_color": "black",
+        "ray_trace_disco_factor": 1,
+        "ray_opaque_background": 1,
+        "ray_transparency_oblique": 1,
+        "ray_transparency_oblique_power": 0,
+        "ray_transparency_contrast": 3,
+    }
+)
+
 
 def goodsell_spheres(
     obj: str,
-    transparency: str = "0",
+    transparency: float = 0.0,
+    scene: int = 1,
 ) -> None:
     """Style object or selection in Goodsell-like style spheres.
 
@@ -25,6 +57,8 @@ def goodsell_spheres(
     ----
         obj: name of object or selection to apply styling
         transparency: transparency level between 0 to 1
+        scene: also apply the scene-wide Goodsell settings (default: 1); use 0 when styling
+            several selections after a single goodsell_scene call
 
     Returns
     -------
@@ -35,37 +69,47 @@ def goodsell_spheres(
 
     cmd.hide("everything", obj)
     cmd.show("spheres", obj)
-    cmd.set("sphere_transparency", transparency, obj)
-    _set_goodsell_scene()
-
-
-def _set_goodsell_scene() -> None:
-    """Set lighting, style, and rendering parameters for David Goodsell-like style rendering."""
-    # Set to max performance view
-    util.performance(0)
-
-    # Goodsell-like style
-    cmd.space("cmyk")
-    cmd.bg_color("white")
-    cmd.set("specular", 0)
-    cmd.set("depth_cue", 0)
-    cmd.set("orthoscopic", 0)
-    cmd.set("opaque_background", 1)
-    cmd.set("show_alpha_checker", 0)
-
-    # Goodsell-like lighting
-    goodsell_lighting()
-
-    # Goodsell-like rendering
-    cmd.set("antialias", 2)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_trace_gain", 1.5)
-    cmd.set("ray_trace_color", "black")
-    cmd.set("ray_trace_disco_factor", 1)
-    cmd.set("ray_opaque_background", 1)
-    cmd.set("ray_transparency_oblique")
-    cmd.set("ray_transparency_oblique_power", 0)
-    cmd.set("ray_transparency_contrast", 3)
+    cmd.set("sphere_transparency", float(transparency), obj)
+    if int(scene):
+        goodsell_scene()
+
+
+def goodsell_scene() -> None:
+    """Set lighting, style, and rendering parameters for David Goodsell-like style rendering.
+
+    These settings are global to the session, so they only need to be applied once no matter
+    how many selections are styled with goodsell_spheres.
+
+    Returns
+    -------
+        None
+    """
+    # Deferred so psico is only imported once the style is actually used
+    from psico.viewing import goodsell_lighting  # noqa: PLC0415
+
+    _set = cmd.set
+
+    # Hold redraws until the whole scene is configured
+    suspend_updates = cmd.get_setting_int("suspend_updates")
+    _set("suspend_updates", 1)
+    try:
+        # Set to max performance view
+        util.performance(0)
+
+        # Goodsell-like style
+        cmd.space("cmyk")
+        cmd.bg_color("white")
+        for name, value in _GOODSELL_STYLE_SETTINGS.items():
+            _set(name, value)
+
+        # Goodsell-like lighting
+        goodsell_lighting()
+
+        # Goodsell-like rendering
+        for name, value in _GOODSELL_RENDER_SETTINGS.items():
+            _set(name, value)
+    finally:
+        _set("suspend_updates", suspend_updates)
 
 
 ####################################################################################################
@@ -78,6 +122,7 @@ if __name__ == "pymol":
 
     # Extend PyMOL commands
     cmd.extend("goodsell_spheres", goodsell_spheres)
+    cmd.extend("goodsell_scene", goodsell_scene)
 
 
 if __name__ == "__main__":
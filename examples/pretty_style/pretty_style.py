@@ -7,17 +7,49 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
 from pymol import cmd, util
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 ####################################################################################################
 ## Define
 ####################################################################################################
 
+# Scene-wide settings applied by _set_pretty_scene, in order
+_PRETTY_SCENE_SETTINGS: Final[Mapping[str, float | str]] = MappingProxyType(
+    {
+        # Pretty style
+        "specular": 1,
+        "depth_cue": 0,
+        "orthoscopic": 0,
+        "opaque_background": 1,
+        "show_alpha_checker": 0,
+        "ambient": 0.5,
+        "spec_count": 5,
+        "shininess": 50,
+        "reflect": 0.1,
+        # Pretty rendering
+        "antialias": 2,
+        "ray_trace_mode": 1,
+        "ray_trace_gain": 0,
+        "ray_trace_color": "black",
+        "ray_trace_disco_factor": 1,
+        "ray_opaque_background": 1,
+        "ray_transparency_oblique": 1,
+        "ray_transparency_oblique_power": 0,
+        "ray_transparency_contrast": 3,
+    }
+)
+
 
 def pretty_surface(
     obj: str,
     color: str = "grey95",
-    transparency: str = "0.5",
+    transparency: float = 0.5,
 ) -> None:
     """Style object or selection in pretty style surface with cartoon ribbon layer behind.
 
@@ -38,39 +70,28 @@ def pretty_surface(
     cmd.show("cartoon", obj + " and polymer")
     cmd.show("surface", obj + " and polymer")
     cmd.set("surface_color", color, obj + " and polymer")
-    cmd.set("transparency", transparency, obj + " and polymer")
+    cmd.set("transparency", float(transparency), obj + " and polymer")
     _set_pretty_scene()
 
 
 def _set_pretty_scene() -> None:
     """Set lighting, style, and rendering parameters for pretty style rendering."""
-    # Set to max performance view
-    util.performance(0)
-
-    # Pretty style
-    cmd.space("cmyk")
-    cmd.bg_color("white")
-    cmd.set("specular", 1)
-    cmd.set("depth_cue", 0)
-    cmd.set("orthoscopic", 0)
-    cmd.set("opaque_background", 1)
-    cmd.set("show_alpha_checker", 0)
-    cmd.set("ambient", 0.5)
-    cmd.set("spec_count", 5)
-    cmd.set("shininess", 50)
-    cmd.set("reflect", 0.1)
-
-    # Pretty rendering
-    cmd.set("antialias", 2)
-    cmd.set("ray_trace_mode", 1)
-    cmd.set("ray_trace_gain", 0)
-    cmd.set("ray_trace_color", "black")
-    cmd.set("ray_trace_disco_factor", 1)
-    cmd.set("ray_opaque_background", 1)
-    cmd.set("ray_transparency_oblique")
-    cmd.set("ray_transparency_oblique_power", 0)
-    cmd.set("ray_transparency_contrast", 3)
-
+    _set = cmd.set
+
+    # Hold redraws until the whole scene is configured
+    suspend_updates = cmd.get_setting_int("suspend_updates")
+    _set("suspend_updates", 1)
+    try:
+        # Set to max performance view
+        util.performance(0)
+
+        # Pretty style and rendering
+        cmd.space("cmyk")
+        cmd.bg_color("white")
+        for name, value in _PRETTY_SCENE_SETTINGS.items():
+            _set(name, value)
+    finally:
+        _set("suspend_updates", suspend_updates)
 
 
 ####################################################################################################
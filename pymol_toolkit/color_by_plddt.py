@@ -7,12 +7,32 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
 from pymol import cmd  # type: ignore[import-untyped]
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 ####################################################################################################
 ## Define
 ####################################################################################################
 
+# pLDDT colors ordered from lowest to highest confidence, converted from 0-255 to 0-1 once
+_PLDDT_COLORS: Final[Mapping[str, tuple[float, ...]]] = MappingProxyType(
+    {
+        color_name: tuple(c / 255.0 for c in rgb)
+        for color_name, rgb in (
+            ("plddt_very_low", (238, 132, 83)),
+            ("plddt_low", (249, 220, 77)),
+            ("plddt_high", (127, 201, 239)),
+            ("plddt_very_high", (33, 81, 204)),
+        )
+    }
+)
+_PLDDT_COLOR_NAMES: Final = tuple(_PLDDT_COLORS)
+
 
 def color_by_plddt(
     obj: str,
@@ -41,49 +61,21 @@ def color_by_plddt(
 
     _setup_plddt_colors()
 
-    atom_data: list[tuple[int, float]] = []
-    cmd.iterate(obj, "atom_data.append((index, b))", space={"atom_data": atom_data})
-
-    if not atom_data:
-        raise ValueError(f"No B-factor data found for selection: '{obj}'")
-
-    for atom_index, b_factor in atom_data:
-        color_name = _get_plddt_color_name(
-            b_factor, very_high_threshold, high_threshold, low_threshold
-        )
-        cmd.color(color_name, f"index {atom_index}")
+    # Paint each confidence level over the ones below it. Selecting on b keeps the comparison
+    # inside PyMOL: one call per level and no Python evaluation per atom. Values on a
+    # threshold fall into the lower confidence level.
+    thresholds = (low_threshold, high_threshold, very_high_threshold)
+    cmd.color(_PLDDT_COLOR_NAMES[0], obj)
+    for color_name, threshold in zip(_PLDDT_COLOR_NAMES[1:], thresholds, strict=True):
+        cmd.color(color_name, f"({obj}) and b > {threshold}")
 
 
 def _setup_plddt_colors() -> None:
     """Set up pLDDT color definitions in PyMOL."""
-    colors = {
-        "very_high": (33, 81, 204),
-        "high": (127, 201, 239),
-        "low": (249, 220, 77),
-        "very_low": (238, 132, 83),
-    }
-
-    # Set PyMOL colors (convert from 0-255 to 0-1 range)
-    for confidence_level, rgb in colors.items():
-        color_name = f"plddt_{confidence_level}"
-        rgb_normalized = [c / 255.0 for c in rgb]
+    for color_name, rgb_normalized in _PLDDT_COLORS.items():
         cmd.set_color(color_name, rgb_normalized)
 
 
-def _get_plddt_color_name(
-    b_factor: float, very_high_threshold: float, high_threshold: float, low_threshold: float
-) -> str:
-    """Determine the appropriate pLDDT color name based on B-factor value."""
-    if b_factor > very_high_threshold:
-        return "plddt_very_high"
-    elif b_factor > high_threshold:
-        return "plddt_high"
-    elif b_factor > low_threshold:
-        return "plddt_low"
-    else:
-        return "plddt_very_low"
-
-
 ####################################################################################################
 ## RUN
 ####################################################################################################
@@ -10,13 +10,15 @@ This module loads color palettes defined in palette.yaml into PyMOL.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import os
+import warnings
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import pymol  # type: ignore[import-untyped]
-import yaml
-from pymol import cmd
+from pymol import cmd  # type: ignore[import-untyped]
 
 if TYPE_CHECKING:
     from typing import Any
@@ -38,15 +40,18 @@ def find_palette_file() -> Path:
         FileNotFoundError: If no palette.yaml is found in any location
     """
     # Search locations in order of precedence
-    search_paths = [
-        Path.cwd() / "palette.yaml",  # Current directory
-        Path(os.getenv("PYMOL_CUSTOM_PALETTE", "")).expanduser(),  # Environment variable
-        Path.home() / ".pymol" / "palette.yaml",  # User config directory
-    ]
+    search_paths = [Path.cwd() / "palette.yaml"]  # Current directory
+    env_path = os.getenv("PYMOL_CUSTOM_PALETTE")
+    if env_path:
+        search_paths.append(Path(env_path).expanduser())  # Environment variable
+    search_paths.append(Path.home() / ".pymol" / "palette.yaml")  # User config directory
 
     for path in search_paths:
-        if path.is_file():
-            return path
+        try:
+            if path.is_file():
+                return path
+        except OSError:
+            continue
 
     raise FileNotFoundError("No palette.yaml found!")
 
@@ -54,6 +59,10 @@ def find_palette_file() -> Path:
 def load_palette_colors(yaml_path: str | Path) -> dict[str, dict[str, list[Any]]]:
     """Load color palette definitions from a YAML file.
 
+    Validated palettes are cached next to the YAML file (e.g. palette.cache.json) together
+    with a SHA-256 digest of the YAML contents; the cache is only reused when the digest
+    matches and the cached palettes pass the same validation as the YAML file.
+
     Args
     ----
         yaml_path: Path to the YAML file containing palette definitions
@@ -61,10 +70,25 @@ def load_palette_colors(yaml_path: str | Path) -> dict[str, dict[str, list[Any]]
     Returns
     -------
         Dict[str, List[str, Tuple[int, int, int]]]: Validated data structure
+
+    Raises
+    ------
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the file contains invalid YAML
+        ValueError: If the data structure doesn't match expected format
     """
-    palette_data = _load_yaml(yaml_path)
+    yaml_path = Path(yaml_path)
+    cache_path = yaml_path.with_suffix(".cache.json")
+
+    # Read the YAML once; the same bytes feed the cache digest and, on a miss, the parser
+    yaml_bytes = _read_yaml(yaml_path)
+    source_sha256 = hashlib.sha256(yaml_bytes).hexdigest()
+
+    palette_data = _load_cache(cache_path, source_sha256)
+    if palette_data is None:
+        palette_data = _parse_yaml(yaml_bytes)
+        _write_cache(cache_path, source_sha256, palette_data)
 
-    # return palette_colors
     return palette_data
 
 
@@ -83,6 +107,17 @@ def add_palette_colors(palettes: dict[str, dict[str, list[Any]]]) -> str:
     --------
         >>> msg = add_palette_colors({'oranges': {'darkorange': [198, 101, 38]}})  # Apply palette
     """
+    try:
+        # Import explicitly; pymol.menu is otherwise only loaded as a side effect of cmd calls
+        from pymol import menu  # noqa: PLC0415
+
+        all_colors = menu.all_colors_list
+    except (ImportError, AttributeError) as e:
+        raise ImportError("PyMOL version too old for colors menu. Requires 1.6.0 or later.") from e
+
+    # Snapshot existing menus once so each palette is a set lookup instead of a list scan
+    registered_menus = {(menu_name, tuple(menu_colors)) for menu_name, menu_colors in all_colors}
+
     msg = ""
     for name, palette in palettes.items():
         added_colors = []
@@ -93,25 +128,20 @@ def add_palette_colors(palettes: dict[str, dict[str, list[Any]]]) -> str:
             cmd.set_color(color_name, rgb_normalized)
             added_colors.append(f"    {color_name}")
             color_tuples.append((rgb_short_code, color_name))
-        menu_colors = (name, color_tuples)
-        try:
-            all_colors = pymol.pymol.menu.all_colors_list
-        except (ImportError, AttributeError) as e:
-            raise ImportError(
-                "PyMOL version too old for colors menu. Requires 1.6.0 or later."
-            ) from e
+        menu_key = (name, tuple(color_tuples))
 
-        if menu_colors in all_colors:
+        if menu_key in registered_menus:
             msg += f"  - Menu for {name} was already added!"
         else:
-            all_colors.append(menu_colors)
+            all_colors.append((name, color_tuples))
+            registered_menus.add(menu_key)
             msg += f"\n\nThe {name} palette is now available:\n"
             msg += "\n".join(added_colors)
     return msg
 
 
-def _load_yaml(file_path: str | Path) -> dict[str, dict[str, list[Any]]]:
-    """Check input values from palette yaml file.
+def _read_yaml(file_path: str | Path) -> bytes:
+    """Read the raw contents of a palette yaml file in a single read.
 
     Args
     ----
@@ -119,25 +149,64 @@ def _load_yaml(file_path: str | Path) -> dict[str, dict[str, list[Any]]]:
 
     Returns
     -------
-        Dict[str, Dict[str, List[int, int, int]]]: Validated data structure
+        Raw file contents
 
     Raises
     ------
         FileNotFoundError: If the file doesn't exist
-        yaml.YAMLError: If the file contains invalid YAML
-        ValueError: If the data structure doesn't match expected format
     """
     if not Path(file_path).exists():
         raise FileNotFoundError(f"YAML file not found: {file_path}")
 
     try:
-        with open(file_path, "r", encoding="utf-8") as yf:
-            data = yaml.safe_load(yf)
-    except yaml.YAMLError as e:
-        raise yaml.YAMLError(f"Error parsing YAML file: {e}") from e
+        return Path(file_path).read_bytes()
     except Exception as e:
         raise Exception(f"Error reading file: {e}") from e
 
+
+def _parse_yaml(yaml_bytes: bytes) -> dict[str, dict[str, list[Any]]]:
+    """Parse and validate palette definitions from raw yaml file contents.
+
+    Args
+    ----
+        yaml_bytes: Raw contents of a YAML file containing palette definitions
+
+    Returns
+    -------
+        Dict[str, Dict[str, List[int, int, int]]]: Validated data structure
+
+    Raises
+    ------
+        yaml.YAMLError: If the contents are invalid YAML
+        ValueError: If the data structure doesn't match expected format
+    """
+    # Imported lazily; YAML is only parsed when the JSON cache is missing or stale
+    import yaml  # noqa: PLC0415
+
+    try:
+        # Hand raw bytes to the loader; libyaml decodes UTF-8 itself
+        data = yaml.load(yaml_bytes, Loader=_get_yaml_loader())
+    except yaml.YAMLError as e:
+        raise yaml.YAMLError(f"Error parsing YAML file: {e}") from e
+
+    return _validate_palettes(data)
+
+
+def _validate_palettes(data: Any) -> dict[str, dict[str, list[Any]]]:
+    """Check palette definitions parsed from a palette yaml file or its cache.
+
+    Args
+    ----
+        data: Parsed palette definitions
+
+    Returns
+    -------
+        Dict[str, Dict[str, List[int, int, int]]]: Validated data structure
+
+    Raises
+    ------
+        ValueError: If the data structure doesn't match expected format
+    """
     if not isinstance(data, dict):
         raise ValueError("YAML root must be a dictionary")
 
@@ -170,38 +239,88 @@ def _load_yaml(file_path: str | Path) -> dict[str, dict[str, list[Any]]]:
             if not rgb_list:
                 raise ValueError(f"Empty list found for '{name}.{color_name}'")
 
-            # Validate and convert rgb ints
-            validated_ints = []
             if len(rgb_list) != 3:  # noqa: PLR2004
                 raise ValueError(
                     f"RGB list must have exactly 3 values at '{name}.{color_name}': {rgb_list}"
                 )
 
+            # Validate and convert rgb ints in a single pass
+            rgb = [0, 0, 0]
             for ii, value in enumerate(rgb_list):
                 try:
-                    # Convert to int if it's a valid number
-                    if isinstance(value, (int, float)):
-                        vv = int(value)
-                    elif isinstance(value, str) and value.strip().lstrip("-").isdigit():
-                        vv = int(value)
-                    else:
-                        raise ValueError(f"Invalid integer at '{name}.{color_name}[{ii}]': {value}")
-                except ValueError, TypeError:
+                    # Strings must be plain (optionally negative) digits; int() alone would
+                    # also accept forms such as "+5" or "1_0"
+                    if isinstance(value, str) and not value.strip().lstrip("-").isdigit():
+                        raise ValueError(value)
+                    vv = int(value)
+                except TypeError, ValueError, OverflowError:
                     raise ValueError(
                         f"Cannot convert to integer at '{name}.{color_name}[{ii}]': {value}"
                     ) from None
-                if 0 <= vv <= 255:  # noqa: PLR2004
-                    validated_ints.append(vv)
-                else:
+                if not 0 <= vv <= 255:  # noqa: PLR2004
                     raise ValueError(
                         "RGB values must be numbers in range 0-255 at"
                         + f"'{name}.{color_name}[{ii}]': {value}"
                     )
-            validated_items[color_name] = validated_ints
+                rgb[ii] = vv
+            validated_items[color_name] = rgb
         validated_data[name] = validated_items
     return validated_data
 
 
+def _load_cache(cache_path: Path, source_sha256: str) -> dict[str, dict[str, list[Any]]] | None:
+    """Return cached palette data if it was built from YAML contents with the given digest.
+
+    Returns
+    -------
+        Validated palette data, or None if the cache is missing, stale, unreadable, or invalid.
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as cf:
+            cache = json.load(cf)
+    except OSError, ValueError:
+        return None
+
+    if not isinstance(cache, dict) or cache.get("source_sha256") != source_sha256:
+        return None
+
+    try:
+        return _validate_palettes(cache.get("palettes"))
+    except ValueError:
+        return None
+
+
+def _write_cache(
+    cache_path: Path, source_sha256: str, palette_data: dict[str, dict[str, list[Any]]]
+) -> None:
+    """Write validated palette data to the JSON cache, ignoring unwritable locations."""
+    try:
+        with open(cache_path, "w", encoding="utf-8") as cf:
+            json.dump({"source_sha256": source_sha256, "palettes": palette_data}, cf)
+    except OSError:
+        pass
+
+
+@functools.cache
+def _get_yaml_loader() -> Any:
+    """Return the libyaml-backed safe loader, falling back to the pure-Python one.
+
+    Returns
+    -------
+        yaml.CSafeLoader if PyYAML was built with libyaml, otherwise yaml.SafeLoader.
+    """
+    import yaml  # noqa: PLC0415
+
+    loader = getattr(yaml, "CSafeLoader", None)
+    if loader is None:
+        warnings.warn(
+            "PyYAML was built without libyaml; palette files are parsed with the slower SafeLoader",
+            stacklevel=2,
+        )
+        loader = yaml.SafeLoader
+    return loader
+
+
 def _get_normalized_rgb(rgb: list[Any]) -> tuple[float, float, float]:
     """Return RGB values normalized to 0-1 range for PyMOL.
 
@@ -221,7 +340,8 @@ def _get_short_code(rgb: list[Any]) -> str:
         3-digit string representing RGB values in 0-9 range.
     """
     r, g, b = rgb
-    return f"{int(r / 255.1 * 10)}{int(g / 255.1 * 10)}{int(b / 255.1 * 10)}"
+    # Integer bucketing of 0-255 into 0-9 (255 * 10 // 256 == 9)
+    return f"{r * 10 // 256}{g * 10 // 256}{b * 10 // 256}"
 
 
 ####################################################################################################
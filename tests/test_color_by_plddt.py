@@ -0,0 +1,99 @@
+"""Tests for pymol_toolkit.color_by_plddt."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from pymol import cmd  # type: ignore[import-untyped]
+
+from pymol_toolkit.color_by_plddt import color_by_plddt
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+MODEL_PDB = Path(__file__).parents[1] / "examples" / "color_by_plddt" / "AF-O60674-F1-model_v6.pdb"
+
+
+def _expected_color_name(
+    b_factor: float, very_high_threshold: float, high_threshold: float, low_threshold: float
+) -> str:
+    """Return the pLDDT color name using the original if/elif bucketing."""
+    if b_factor > very_high_threshold:
+        return "plddt_very_high"
+    elif b_factor > high_threshold:
+        return "plddt_high"
+    elif b_factor > low_threshold:
+        return "plddt_low"
+    else:
+        return "plddt_very_low"
+
+
+def _atom_colors(selection: str) -> list[tuple[int, float, int]]:
+    """Return (index, b, color) for every atom in the selection."""
+    atoms: list[tuple[int, float, int]] = []
+    cmd.iterate(selection, "atoms.append((index, b, color))", space={"atoms": atoms})
+    return atoms
+
+
+@pytest.fixture
+def model() -> Iterator[str]:
+    """Load the bundled AlphaFold model into a clean session."""
+    cmd.reinitialize()
+    cmd.load(str(MODEL_PDB), "af_model")
+    yield "af_model"
+    cmd.delete("all")
+
+
+@pytest.mark.parametrize("thresholds", [(90.0, 70.0, 50.0), (80.0, 60.0, 40.0)])
+def test_colors_match_bucketing(model: str, thresholds: tuple[float, float, float]) -> None:
+    """Every atom gets the color of its pLDDT confidence level."""
+    color_by_plddt(model, *thresholds)
+
+    atoms = _atom_colors(model)
+    assert atoms
+    for index, b_factor, color in atoms:
+        expected = cmd.get_color_index(_expected_color_name(b_factor, *thresholds))
+        assert color == expected, f"atom {index} with b={b_factor}"
+
+
+def test_levels_all_used(model: str) -> None:
+    """The bundled model spans all four confidence levels with the default thresholds."""
+    color_by_plddt(model)
+
+    colors = {color for _, _, color in _atom_colors(model)}
+    names = ("plddt_very_high", "plddt_high", "plddt_low", "plddt_very_low")
+    assert colors == {cmd.get_color_index(name) for name in names}
+
+
+def test_value_on_threshold_gets_lower_level(model: str) -> None:
+    """A B-factor exactly equal to a threshold falls into the lower confidence level."""
+    for index, b_factor in ((1, 90.0), (2, 70.0), (3, 50.0)):
+        cmd.alter(f"{model} and index {index}", f"b = {b_factor}")
+
+    color_by_plddt(model)
+
+    colors = {index: color for index, _, color in _atom_colors(f"{model} and index 1-3")}
+    assert colors == {
+        1: cmd.get_color_index("plddt_high"),
+        2: cmd.get_color_index("plddt_low"),
+        3: cmd.get_color_index("plddt_very_low"),
+    }
+
+
+def test_other_objects_untouched(model: str) -> None:
+    """Atoms in other objects, including ones sharing an atom index, keep their color."""
+    cmd.load(str(MODEL_PDB), "other")
+    cmd.color("white", "other")
+
+    color_by_plddt(model)
+
+    white = cmd.get_color_index("white")
+    assert all(color == white for _, _, color in _atom_colors("other"))
+
+
+def test_empty_selection_raises(model: str) -> None:
+    """An empty selection raises ValueError."""
+    with pytest.raises(ValueError, match="No atoms found"):
+        color_by_plddt(f"{model} and b > 1000")
@@ -0,0 +1,177 @@
+"""Tests for the palette loading and JSON cache in pymol_toolkit.load_palette."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pymol_toolkit.load_palette import _validate_palettes, load_palette_colors
+
+OLD_YAML = "oranges:\n  darkorange: [198, 101, 38]\n"
+NEW_YAML = "blues:\n  darkblue: [48, 35, 131]\n"
+OLD_PALETTES = {"oranges": {"darkorange": [198, 101, 38]}}
+NEW_PALETTES = {"blues": {"darkblue": [48, 35, 131]}}
+
+
+def _write_palette(tmp_path: Path, text: str) -> tuple[Path, Path]:
+    """Write a palette.yaml file and return it with its cache path."""
+    yaml_path = tmp_path / "palette.yaml"
+    yaml_path.write_text(text, encoding="utf-8")
+    return yaml_path, tmp_path / "palette.cache.json"
+
+
+def test_cache_written_and_reused(tmp_path: Path) -> None:
+    """A first load writes the cache and a second load is served from it."""
+    yaml_path, cache_path = _write_palette(tmp_path, OLD_YAML)
+
+    assert load_palette_colors(yaml_path) == OLD_PALETTES
+    assert cache_path.is_file()
+
+    # Make the cached palettes distinguishable from the YAML contents
+    cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    cache["palettes"] = NEW_PALETTES
+    cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+    assert load_palette_colors(yaml_path) == NEW_PALETTES
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_yaml_read_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, cached: bool) -> None:
+    """The YAML file is read exactly once on both a cache miss and a cache hit."""
+    yaml_path, _ = _write_palette(tmp_path, OLD_YAML)
+    if cached:
+        load_palette_colors(yaml_path)
+
+    reads: list[Path] = []
+    read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self: Path) -> bytes:
+        reads.append(self)
+        return read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+
+    assert load_palette_colors(yaml_path) == OLD_PALETTES
+    assert reads == [yaml_path]
+
+
+def test_cache_refreshed_when_yaml_is_newer(tmp_path: Path) -> None:
+    """Editing the YAML file after the cache was written invalidates the cache."""
+    yaml_path, cache_path = _write_palette(tmp_path, OLD_YAML)
+    load_palette_colors(yaml_path)
+
+    yaml_path.write_text(NEW_YAML, encoding="utf-8")
+    cache_stat = cache_path.stat()
+    os.utime(yaml_path, ns=(cache_stat.st_atime_ns, cache_stat.st_mtime_ns + 10**9))
+
+    assert load_palette_colors(yaml_path) == NEW_PALETTES
+    assert load_palette_colors(yaml_path) == NEW_PALETTES
+
+
+@pytest.mark.parametrize("mtime_offset_ns", [0, -(10**9)])
+def test_cache_refreshed_when_yaml_replaced_with_same_or_older_mtime(
+    tmp_path: Path, mtime_offset_ns: int
+) -> None:
+    """A replaced YAML file is detected even if its mtime is not newer than the cache."""
+    yaml_path, cache_path = _write_palette(tmp_path, OLD_YAML)
+    load_palette_colors(yaml_path)
+
+    # Replacement as left by cp -p, rsync -a, or tar x, or edited within the same mtime tick
+    yaml_path.write_text(NEW_YAML, encoding="utf-8")
+    cache_stat = cache_path.stat()
+    os.utime(yaml_path, ns=(cache_stat.st_atime_ns, cache_stat.st_mtime_ns + mtime_offset_ns))
+
+    assert load_palette_colors(yaml_path) == NEW_PALETTES
+
+
+@pytest.mark.parametrize(
+    "cache_text",
+    [
+        "{not json",
+        "[1, 2]",
+        '{"source_sha256": null, "palettes": {"oranges": {"darkorange": [1, 2, 3]}}}',
+    ],
+)
+def test_malformed_cache_falls_back_to_yaml(tmp_path: Path, cache_text: str) -> None:
+    """Unparseable or mismatched caches are ignored and rebuilt from the YAML file."""
+    yaml_path, cache_path = _write_palette(tmp_path, OLD_YAML)
+    cache_path.write_text(cache_text, encoding="utf-8")
+
+    assert load_palette_colors(yaml_path) == OLD_PALETTES
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["palettes"] == OLD_PALETTES
+
+
+@pytest.mark.parametrize(
+    "palettes",
+    [[1, 2], {"oranges": [1, 2]}, {"oranges": {"darkorange": [1, 2]}}],
+)
+def test_invalid_cached_palettes_fall_back_to_yaml(tmp_path: Path, palettes: object) -> None:
+    """Cached palettes that fail validation are ignored even if the digest matches."""
+    yaml_path, cache_path = _write_palette(tmp_path, OLD_YAML)
+    load_palette_colors(yaml_path)
+
+    cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    cache["palettes"] = palettes
+    cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+    assert load_palette_colors(yaml_path) == OLD_PALETTES
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0,
+    reason="directory permissions are not enforced for root",
+)
+def test_unwritable_directory(tmp_path: Path) -> None:
+    """Palettes still load when the cache cannot be written next to the YAML file."""
+    yaml_path, cache_path = _write_palette(tmp_path, OLD_YAML)
+    tmp_path.chmod(0o555)
+    try:
+        assert load_palette_colors(yaml_path) == OLD_PALETTES
+        assert not cache_path.exists()
+    finally:
+        tmp_path.chmod(0o755)
+
+
+def test_unwritable_cache_path(tmp_path: Path) -> None:
+    """Palettes still load when the cache path cannot be opened for writing."""
+    yaml_path, cache_path = _write_palette(tmp_path, OLD_YAML)
+    cache_path.mkdir()
+
+    assert load_palette_colors(yaml_path) == OLD_PALETTES
+
+
+@pytest.mark.parametrize("value", ["+5", "1_0", "12.5", "0x10", "", None, float("inf")])
+def test_invalid_rgb_values_rejected(value: object) -> None:
+    """RGB values that are not plain integers or digit strings are rejected."""
+    with pytest.raises(ValueError, match="Cannot convert to integer"):
+        _validate_palettes({"oranges": {"darkorange": [value, 101, 38]}})
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [(198, 198), (198.7, 198), ("198", 198), (" 7 ", 7)]
+)
+def test_valid_rgb_values_converted(value: object, expected: int) -> None:
+    """Integers, floats, and digit strings are converted to ints."""
+    palettes = _validate_palettes({"oranges": {"darkorange": [value, 101, 38]}})
+    assert palettes["oranges"]["darkorange"] == [expected, 101, 38]
+
+
+def test_add_palette_colors_in_fresh_interpreter() -> None:
+    """Palette menus can be added before any other PyMOL command has run."""
+    code = (
+        "from pymol_toolkit.load_palette import add_palette_colors\n"
+        "from pymol import menu\n"
+        "print(add_palette_colors({'oranges': {'darkorange': [198, 101, 38]}}))\n"
+        "assert ('oranges', [('731', 'darkorange')]) in menu.all_colors_list\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "The oranges palette is now available" in result.stdout